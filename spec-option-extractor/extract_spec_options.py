@@ -2,28 +2,78 @@
 """Parse C# [SpecOption] and [SpecCapability] attributes from .cs files or JSON and generate JS files."""
 
 import argparse
+import functools
+import hashlib
+import io
 import json
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 
-# Matches [SpecOption(...)] including multiline, capturing the attribute body
-SPEC_OPTION_RE = re.compile(
-    r'\[SpecOption\s*\((.*?)\)\s*\]',
-    re.DOTALL
+# One piece of an attribute body: any character except parentheses, quotes
+# and '@', an '@' not opening a string (as in @class), a regular string
+# literal, or a verbatim @"..." literal with "" escapes (which may end in a
+# backslash, e.g. @"C:\Data\"). String literals may contain parentheses,
+# e.g. "CPI-Capped (s101)".
+ATTR_ATOM_PATTERN = r'[^()"@]|@(?!")|"(?:[^"\\]|\\.)*"|@"(?:[^"]|"")*"'
+
+# An attribute body: attribute pieces and up to three levels of nested
+# parentheses, e.g. Description = ("a" + nameof(X)). Every character can only
+# be consumed one way, so a failed match costs linear time instead of
+# backtracking across the file.
+ATTR_BODY_PATTERN = r'(?:{atom})*'.format(atom=ATTR_ATOM_PATTERN)
+for _ in range(3):
+    ATTR_BODY_PATTERN = r'(?:{atom}|\({body}\))*'.format(atom=ATTR_ATOM_PATTERN, body=ATTR_BODY_PATTERN)
+
+# What may sit between an attribute and the declaration it decorates: whitespace,
+# comments (including /// XML doc comments), #region/#endregion lines and other
+# attributes, whose string arguments (regular or verbatim) may contain ']'.
+# Each alternative starts with a different character, so there is a single
+# way to consume any run of these.
+DECL_GAP_PATTERN = (
+    r'(?:\s|//[^\n]*|\#(?:region|endregion)[^\n]*'
+    r'|\[(?!{attr})(?:[^\]"@]|@(?!")|"(?:[^"\\]|\\.)*"|@"(?:[^"]|"")*")*\])*'
 )
 
-# Matches a named parameter like Category = "Revaluation"
-PARAM_STRING_RE = re.compile(
-    r'(\w+)\s*=\s*"((?:[^"\\]|\\.)*)"'
+# Matches a named parameter, either a verbatim string like Path = @"C:\Data\"
+# (groups 1-2), a string literal like Category = "Revaluation" (groups 1, 3)
+# or a constant like Category = SpecCategories.GMP (groups 1, 4-5).
+# \b keeps the engine from retrying the name at every character of a word, and
+# string values are consumed whole so their text is never rescanned.
+PARAM_RE = re.compile(
+    r'\b(\w+)\s*=\s*(?:@"((?:[^"]|"")*)"|"((?:[^"\\]|\\.)*)"|(\w+)\.(\w+))'
 )
 
-# Matches a named parameter using a constant like Category = SpecCategories.GMP
-PARAM_CONST_RE = re.compile(
-    r'(\w+)\s*=\s*(\w+)\.(\w+)'
-)
+# Matches an escape sequence inside a C# string literal: \uHHHH, \UHHHHHHHH,
+# \x followed by one to four hex digits, or a single character
+CSHARP_ESCAPE_RE = re.compile(r'\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|x[0-9A-Fa-f]{1,4}|.)', re.DOTALL)
+
+# Simple C# escape characters and what they stand for
+CSHARP_ESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', '0': '\0', 'a': '\a', 'b': '\b', 'f': '\f', 'v': '\v',
+    '"': '"', "'": "'", '\\': '\\',
+}
+
+# Category words shown in upper case by format_category
+KNOWN_ACRONYMS = frozenset({'gmp', 'dc', 'pcls', 'erf', 'lrf', 'afr', 'cetv'})
+
+# ASCII character classes used by to_snake_id to find word boundaries
+UPPER_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+LOWER_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz')
+LOWER_OR_DIGIT_CHARS = LOWER_CHARS | frozenset('0123456789')
+
+# Build-output and dependency directories that never hold module sources
+PRUNED_DIRS = frozenset({'bin', 'obj', 'node_modules', 'packages'})
+
+# Directory mode only fans out to worker processes for at least this many files
+PARALLEL_MIN_FILES = 64
+
+# Write buffer for the generated JS files, so records reach the disk in large chunks
+OUTPUT_BUFFER_SIZE = 1 << 20
 
 # Known constant mappings (populated from SpecCategories.cs or hardcoded fallback)
 KNOWN_CONSTANTS = {
@@ -36,39 +86,62 @@ KNOWN_CONSTANTS = {
     }
 }
 
-# Matches the class name from a class declaration following the attribute.
-# Robust: skips XML doc comments (/// ...), other attributes ([...]),
-# #region/#endregion, and blank lines between attribute and class declaration.
-CLASS_NAME_RE = re.compile(
-    r'\[SpecOption\s*\(.*?\)\s*\]'
-    r'(?:\s*(?:///[^\n]*|//[^\n]*|\#(?:region|endregion)[^\n]*|\[(?!SpecOption)[^\]]*\]))*'
-    r'\s*public\s+(?:sealed\s+|abstract\s+|static\s+|partial\s+)*class\s+(\w+)',
-    re.DOTALL
+# Single-pass tokenizer for a C# source file. Each match is one of:
+#   - a string or char literal (no named group): regular "...", verbatim
+#     @"..." with "" escapes, or '.'; skipped so that "/api/*" or
+#     "http://..." is not taken for the start of a comment
+#   - a // or /* */ comment (no named group), skipped so commented-out code
+#     is ignored
+#   - option / capability: a [SpecOption(...)] or [SpecCapability(...)]
+#     attribute, capturing the attribute body
+#   - class_name: a public class declaration, capturing the class name;
+#     class_mods holds any modifiers (sealed, static, ...)
+#   - method: a public method signature, capturing return_type, method_name
+#     and parameters; has_body is set when a body ({ or =>) follows
+# Handles generic return types like Task<decimal> and expression-bodied members.
+# Every alternative starts with a distinct literal, so the engine can skip
+# straight to candidate positions. The return type and parameter list are
+# length-bounded: unbounded, a run of public members without a matching
+# signature made each 'public' rescan to the end of the file (quadratic).
+TOKEN_RE = re.compile(
+    r'"(?:[^"\\\n]|\\.)*"'
+    r'|(?:@\$?|\$@)"(?:[^"]|"")*"'
+    r"|'(?:[^'\\\n]|\\[^\n][0-9A-Fa-f]{0,7})'"
+    r'|//[^\n]*'
+    r'|/\*(?:[^*]|\*(?!/))*\*/'
+    r'|\[Spec(?:Option\s*\((?P<option>' + ATTR_BODY_PATTERN + r')\)'
+    r'|Capability\s*\((?P<capability>' + ATTR_BODY_PATTERN + r')\))\s*\]'
+    r'|public\s+(?:'
+    r'(?P<class_mods>(?:sealed\s+|abstract\s+|static\s+|partial\s+)*)class\s+(?P<class_name>\w+)'
+    r'|(?P<method>(?:static\s+|virtual\s+|override\s+|async\s+)*'
+    r'(?P<return_type>[\w<>,\s]{1,256}?)\s+(?P<method_name>\w+)\s*\((?P<parameters>[^)]{0,4096})\)'
+    r'(?P<has_body>\s*(?:\{|=>))?)'
+    r')'
 )
 
-# Matches [SpecCapability(...)] including multiline, capturing the attribute body
-SPEC_CAPABILITY_RE = re.compile(
-    r'\[SpecCapability\s*\((.*?)\)\s*\]',
-    re.DOTALL
-)
+# Matches the text allowed between a Spec attribute and the declaration it
+# decorates: XML doc comments (/// ...), other attributes ([...]),
+# #region/#endregion, and blank lines.
+DECL_GAP_RE = re.compile(DECL_GAP_PATTERN.format(attr=r'Spec(?:Option|Capability)\b'))
 
-# Matches a method signature following a [SpecCapability] attribute.
-# Robust: skips XML doc comments, other attributes, #region/#endregion.
-# Handles generic return types like Task<decimal>, expression-bodied members.
-METHOD_SIG_RE = re.compile(
-    r'\[SpecCapability\s*\(.*?\)\s*\]'
-    r'(?:\s*(?:///[^\n]*|//[^\n]*|\#(?:region|endregion)[^\n]*|\[(?!SpecCapability)[^\]]*\]))*'
-    r'\s*public\s+(?:static\s+|virtual\s+|override\s+|async\s+)*'
-    r'([\w<>,\s]+?)\s+(\w+)\s*\(([^)]*)\)',
-    re.DOTALL
-)
 
-# Matches any public method signature (for coverage report)
-PUBLIC_METHOD_RE = re.compile(
-    r'public\s+(?:static\s+|virtual\s+|override\s+|async\s+)*'
-    r'[\w<>,\s]+?\s+(\w+)\s*\([^)]*\)\s*(?:\{|=>)',
-    re.DOTALL
-)
+def unescape_csharp(value):
+    """Resolve escape sequences (\\", \\n, \\x41, \\u00e9, \\U0001F600, ...) in a C# string literal body.
+
+    Unknown escapes, and \\U values beyond U+10FFFF, are left as they are.
+    """
+    if '\\' not in value:
+        return value
+    return CSHARP_ESCAPE_RE.sub(replace_csharp_escape, value)
+
+
+def replace_csharp_escape(m):
+    """CSHARP_ESCAPE_RE substitution callback for unescape_csharp()."""
+    esc = m.group(1)
+    if len(esc) > 1:  # \u, \U or \x with hex digits
+        code_point = int(esc[1:], 16)
+        return chr(code_point) if code_point <= sys.maxunicode else m.group(0)
+    return CSHARP_ESCAPES.get(esc, m.group(0))
 
 
 def extract_params(body):
@@ -77,17 +150,22 @@ def extract_params(body):
     Handles both string literals (Category = "GMP") and constant references
     (Category = SpecCategories.GMP).
     """
+    # A single findall() builds the match tuples in C, with no per-match
+    # Match object or group() calls. String literal values like
+    # Name = "CPI-Capped (s101)" are taken first; constant references are
+    # resolved afterwards so a string literal always takes priority.
     fields = {}
-    # First pass: string literal values like Name = "CPI-Capped (s101)"
-    for m in PARAM_STRING_RE.finditer(body):
-        fields[m.group(1)] = m.group(2)
-    # Second pass: constant references like Category = SpecCategories.GMP
-    for m in PARAM_CONST_RE.finditer(body):
-        param_name = m.group(1)
+    constants = []
+    for param_name, verbatim, value, class_name, member_name in PARAM_RE.findall(body):
+        if class_name:
+            constants.append((param_name, class_name, member_name))
+        elif verbatim:
+            fields[param_name] = verbatim.replace('""', '"')
+        else:
+            fields[param_name] = unescape_csharp(value)
+    for param_name, class_name, member_name in constants:
         if param_name in fields:
             continue  # string literal already matched (takes priority)
-        class_name = m.group(2)
-        member_name = m.group(3)
         resolved = KNOWN_CONSTANTS.get(class_name, {}).get(member_name)
         if resolved:
             fields[param_name] = resolved
@@ -102,82 +180,330 @@ def parse_spec_option(code):
 
     Returns a dict with parsed fields, or None if no [SpecOption] found.
     """
-    match = SPEC_OPTION_RE.search(code)
-    if not match:
-        return None
+    return parse_file(code)[0]
 
-    fields = extract_params(match.group(1))
 
-    if 'Category' not in fields or 'Name' not in fields:
-        return None
+def parse_file(code):
+    """Parse a C# code string for everything the pipeline needs in one pass.
 
-    class_match = CLASS_NAME_RE.search(code)
-    if class_match:
-        fields['CodeClass'] = class_match.group(1)
+    Walks TOKEN_RE over the code once, pairing each Spec attribute with the
+    declaration that immediately follows it.
 
-    return fields
+    Returns a tuple of:
+      - SpecOption fields (including CodeClass) or None
+      - list of SpecCapability dicts with methodName/returnType/parameters
+      - name of the first plain 'public class' (no modifiers), or None;
+        capabilities are labelled with it
+      - names of public methods that have a body (for the coverage report)
 
+    Files without any Spec attribute are not tokenized at all; the class and
+    method names are only needed for files that have one.
+    """
+    # Every attribute token starts with this literal, so a plain substring
+    # check rules out most files without running the regex engine
+    if '[Spec' not in code:
+        return None, [], None, []
+
+    option = None
+    option_seen = False
+    option_class = None
+    capabilities = []
+    class_name = None
+    public_methods = []
+
+    # The attribute waiting for its declaration: 'option' or 'capability',
+    # plus the capability fields (None if the attribute was incomplete)
+    pending = None
+    pending_fields = None
+    pending_end = 0
+
+    for m in TOKEN_RE.finditer(code):
+        kind = m.lastgroup
+        if kind is None:
+            continue  # literal or comment
+
+        if kind == 'option':
+            if not option_seen:
+                option_seen = True
+                fields = extract_params(m.group('option'))
+                if 'Category' in fields and 'Name' in fields:
+                    option = fields
+            pending, pending_fields, pending_end = 'option', None, m.end()
+            continue
+
+        if kind == 'capability':
+            fields = extract_params(m.group('capability'))
+            if 'Category' in fields and 'Name' in fields:
+                capabilities.append(fields)
+            else:
+                fields = None
+            pending, pending_fields, pending_end = 'capability', fields, m.end()
+            continue
+
+        follows = pending is not None and DECL_GAP_RE.fullmatch(code, pending_end, m.start())
 
+        if kind == 'class_name':
+            name = m.group('class_name')
+            if class_name is None and not m.group('class_mods'):
+                class_name = name
+            if follows and pending == 'option' and option_class is None:
+                option_class = name
+        else:
+            if m.group('has_body'):
+                public_methods.append(m.group('method_name'))
+            if follows and pending == 'capability' and pending_fields is not None:
+                pending_fields['returnType'] = m.group('return_type').strip()
+                pending_fields['methodName'] = m.group('method_name')
+                pending_fields['parameters'] = m.group('parameters').strip()
+
+        pending = None
+
+    if option is not None and option_class:
+        option['CodeClass'] = option_class
+
+    return option, capabilities, class_name, public_methods
+
+
+def get_parsed(module):
+    """Return parse_file() results for a module dict, parsing its code at most once.
+
+    The results are cached on the module under '_parsed' so the options,
+    capabilities and coverage stages all share a single parse per file.
+    A module without code has nothing to report, whatever is cached, so
+    every stage skips the same modules.
+    """
+    code = module.get('code')
+    if not code:
+        return None, [], None, []
+    parsed = module.get('_parsed')
+    if parsed is None:
+        parsed = parse_file(code)
+        module['_parsed'] = parsed
+    return parsed
+
+
+def annotate_modules(modules):
+    """Parse every module once up front so all later stages read cached results."""
+    for module in modules:
+        get_parsed(module)
+    return modules
+
+
+@functools.lru_cache(maxsize=None)
 def to_snake_id(name):
-    """Convert a PascalCase or space-separated name to a snake_case id."""
-    # Insert underscore between a run of uppercase and an uppercase followed by lowercase (e.g. GMPEqualiser -> GMP_Equaliser)
-    s = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
-    # Insert underscore between lowercase/digit and uppercase (e.g. capped -> capped_R)
-    s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-    # Replace spaces/hyphens with underscores
-    s = re.sub(r'[\s\-]+', '_', s)
-    return s.lower()
+    """Convert a PascalCase or space-separated name to a snake_case id.
 
+    Cached: class names recur for every capability and parent-option lookup.
+    """
+    out = []
+    prev = ''
+    in_separator = False
+    last = len(name) - 1
+    for i, c in enumerate(name):
+        # Replace each run of spaces/hyphens with a single underscore
+        if c == '-' or c.isspace():
+            if not in_separator:
+                out.append('_')
+                in_separator = True
+            prev = c
+            continue
+        in_separator = False
+        if c in UPPER_CHARS:
+            # Underscore between lowercase/digit and uppercase (e.g. capped -> capped_R),
+            # and before the last capital of an acronym run (e.g. GMPEqualiser -> GMP_Equaliser)
+            if prev in LOWER_OR_DIGIT_CHARS or (
+                    prev in UPPER_CHARS and i < last and name[i + 1] in LOWER_CHARS):
+                out.append('_')
+        out.append(c)
+        prev = c
+    return ''.join(out).lower()
+
+
+def walk_cs_files(dir_path, scheme='', prune=PRUNED_DIRS):
+    """Yield (os.DirEntry, scheme) for every .cs file under dir_path.
+
+    The scheme is the name of the top-level subdirectory a file sits under
+    ('' for files directly in dir_path). It is fixed on the first descent
+    and passed down, so no per-file path arithmetic is needed.
+
+    Visits each directory's files before its subdirectories, both in name
+    order (the same order as a sorted os.walk). Unreadable directories are
+    skipped, as os.walk does, and so are hidden ones such as .git and .vs
+    and any whose name is in `prune`.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if name[0] != '.' and name not in prune:
+                subdirs.append(entry)
+        elif name[-3:] == '.cs':
+            yield entry, scheme
+
+    for entry in subdirs:
+        yield from walk_cs_files(entry.path, scheme or entry.name, prune)
+
+
+def read_and_parse(filepath, scheme, mtime):
+    """Read one .cs file into a module dict and parse it.
+
+    Runs in worker processes when load_modules_from_dir() is parallel, so the
+    parse results travel back with the module under '_parsed'.
+    """
+    # walk_cs_files() only yields names ending in '.cs', so slice it off
+    module_name = os.path.basename(filepath)[:-3]
+
+    # One unbuffered read of the whole file, then decode and translate newlines
+    # as text mode would; undecodable bytes must not abort the whole run
+    with open(filepath, 'rb', buffering=0) as f:
+        code = f.read().decode('utf-8', errors='replace')
+    if '\r' in code:
+        code = code.replace('\r\n', '\n').replace('\r', '\n')
+
+    last_modified = datetime.fromtimestamp(mtime).strftime('%Y-%m-%dT%H:%M:%S')
+
+    # Stored even for empty files, so every module written to a parse cache
+    # carries its results
+    return {
+        'moduleName': module_name,
+        'scheme': scheme,
+        'code': code,
+        'lastModified': last_modified,
+        '_parsed': parse_file(code),
+    }
 
-def load_modules_from_dir(dir_path, verbose=False):
-    """Walk a directory of .cs files and return module dicts (same shape as JSON input).
 
-    Scheme is derived from the immediate subdirectory name.
-    lastModified is taken from file OS mtime.
+def parser_fingerprint():
+    """Return a digest of this script, so parse caches are dropped whenever the parser changes."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def load_parse_cache(cache_path, dir_path):
+    """Return the {filepath: [[mtime_ns, size], module]} entries cached for dir_path.
+
+    The cache is plain JSON, so loading a planted or shared cache file can
+    never run code. A missing, unreadable or stale cache (other directory or
+    parser version) yields an empty dict, so a bad cache never does worse
+    than no cache.
     """
-    modules = []
-    dir_path = os.path.abspath(dir_path)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):  # missing, truncated or not JSON at all
+        return {}
+    if (not isinstance(cache, dict) or cache.get('parser') != parser_fingerprint()
+            or cache.get('dir') != dir_path):
+        return {}
+    files = cache.get('files')
+    return files if isinstance(files, dict) else {}
+
+
+def cached_module(hit, stamp):
+    """Return the module from a parse cache entry if it is current and well-formed, else None."""
+    if not (isinstance(hit, list) and len(hit) == 2 and hit[0] == stamp
+            and isinstance(hit[1], dict)):
+        return None
+    module = hit[1]
+    parsed = module.get('_parsed')
+    if not (isinstance(parsed, list) and len(parsed) == 4):
+        return None
+    # JSON has no tuples; restore the shape get_parsed() returns
+    module['_parsed'] = tuple(parsed)
+    return module
 
-    for root, dirs, files in os.walk(dir_path):
-        # Sort for deterministic ordering
-        dirs.sort()
-        files.sort()
 
-        for filename in files:
-            if not filename.endswith('.cs'):
-                continue
+def save_parse_cache(cache_path, dir_path, files):
+    """Write the parse cache as JSON, replacing any previous one atomically."""
+    cache = {'parser': parser_fingerprint(), 'dir': dir_path, 'files': files}
+    tmp_path = cache_path + '.tmp'
+    # json.dumps runs the C encoder; json.dump() would encode chunk by chunk in Python
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(cache))
+    os.replace(tmp_path, cache_path)
 
-            filepath = os.path.join(root, filename)
 
-            # Derive scheme from the first subdirectory under dir_path
-            rel_path = os.path.relpath(filepath, dir_path)
-            parts = rel_path.split(os.sep)
-            scheme = parts[0] if len(parts) > 1 else ''
+def load_modules_from_dir(dir_path, verbose=False, jobs=1, cache_path=None, prune=PRUNED_DIRS):
+    """Walk a directory of .cs files and return module dicts (same shape as JSON input).
 
-            module_name = os.path.splitext(filename)[0]
+    Scheme is derived from the immediate subdirectory name.
+    lastModified is taken from file OS mtime.
+    Directories named in `prune` (bin, obj, ... by default) are not entered.
 
-            with open(filepath, 'r') as f:
-                code = f.read()
+    Files are read and parsed in-process by default. With `jobs` above 1, or
+    None for one worker per CPU, they are spread across worker processes once
+    there are at least PARALLEL_MIN_FILES of them. Workers send every file's
+    code back to the parent, and most files need no parse beyond the '[Spec'
+    check, so the pool is opt-in rather than assumed to pay off.
 
-            mtime = os.path.getmtime(filepath)
-            last_modified = datetime.fromtimestamp(mtime).strftime('%Y-%m-%dT%H:%M:%S')
+    With `cache_path`, modules for files whose mtime and size are unchanged
+    since the last run are taken from that cache instead of being read and
+    parsed again, and the cache is rewritten afterwards.
+    """
+    dir_path = os.path.abspath(dir_path)
 
-            modules.append({
-                'moduleName': module_name,
-                'scheme': scheme,
-                'code': code,
-                'lastModified': last_modified,
-            })
+    # The stat comes from the DirEntry rather than a second stat per file
+    filepaths = []
+    schemes = []
+    stats = []
+    for entry, scheme in walk_cs_files(dir_path, prune=prune):
+        filepaths.append(entry.path)
+        schemes.append(scheme)
+        stats.append(entry.stat())
+
+    cached = load_parse_cache(cache_path, dir_path) if cache_path else {}
+    # Lists, not tuples, so they compare equal to the stamps read back from JSON
+    stamps = [[st.st_mtime_ns, st.st_size] for st in stats]
+    modules = []
+    missing = []
+    for i, (filepath, stamp) in enumerate(zip(filepaths, stamps)):
+        module = cached_module(cached.get(filepath), stamp)
+        modules.append(module)
+        if module is None:
+            missing.append(i)
+
+    missing_paths = [filepaths[i] for i in missing]
+    missing_schemes = [schemes[i] for i in missing]
+    missing_mtimes = [stats[i].st_mtime for i in missing]
+
+    parallel = (os.cpu_count() or 1) > 1 if jobs is None else jobs > 1
+    if parallel and len(missing) >= PARALLEL_MIN_FILES:
+        # jobs=None passes max_workers=None, so the executor picks the worker
+        # count and stays within its per-platform limit (61 on Windows)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            parsed = list(executor.map(read_and_parse, missing_paths,
+                                       missing_schemes, missing_mtimes, chunksize=16))
+    else:
+        parsed = [read_and_parse(filepath, scheme, mtime)
+                  for filepath, scheme, mtime in zip(missing_paths, missing_schemes, missing_mtimes)]
 
-            if verbose:
-                print(f"  READ {rel_path} (scheme={scheme})")
+    for i, module in zip(missing, parsed):
+        modules[i] = module
+
+    # An untouched tree leaves the cache as it is, so it is not rewritten
+    if cache_path and (missing or len(cached) != len(filepaths)):
+        save_parse_cache(cache_path, dir_path, {
+            filepath: [stamp, module] for filepath, stamp, module in zip(filepaths, stamps, modules)
+        })
+
+    if verbose:
+        if cache_path:
+            print(f"  Reused {len(filepaths) - len(missing)} cached parses, parsed {len(missing)} files")
+        for filepath, module in zip(filepaths, modules):
+            print(f"  READ {os.path.relpath(filepath, dir_path)} (scheme={module['scheme']})")
 
     return modules
 
 
 def process_modules(modules, verbose=False):
     """Process a list of module dicts and return options grouped by category."""
-    categories = {}
+    categories = defaultdict(list)
 
     for module in modules:
         module_name = module.get('moduleName', '<unknown>')
@@ -188,20 +514,25 @@ def process_modules(modules, verbose=False):
                 print(f"  SKIP {module_name}: no code")
             continue
 
-        fields = parse_spec_option(code)
+        fields = get_parsed(module)[0]
         if not fields:
             if verbose:
                 print(f"  SKIP {module_name}: no [SpecOption] attribute")
             continue
 
-        category = fields['Category'].lower()
+        # Interned so every option in a category shares one key object, and
+        # grouping lookups compare by identity
+        category = sys.intern(fields['Category'].lower())
         # Pluralise 'builder' -> 'builders' to match expected convention
         if category == 'builder':
             category = 'builders'
 
+        # Keep only the date part; slicing at the 'T' allocates no list
         last_modified = module.get('lastModified', '')
-        if last_modified and 'T' in last_modified:
-            last_modified = last_modified.split('T')[0]
+        if last_modified:
+            date_end = last_modified.find('T')
+            if date_end >= 0:
+                last_modified = last_modified[:date_end]
 
         option = {
             'id': to_snake_id(fields.get('CodeClass', module_name)),
@@ -215,42 +546,59 @@ def process_modules(modules, verbose=False):
         if 'WhyItMatters' in fields:
             option['whyItMatters'] = fields['WhyItMatters']
 
-        categories.setdefault(category, []).append(option)
+        categories[category].append(option)
 
         if verbose:
             print(f"  FOUND {module_name} -> {category}/{option['id']}")
 
-    return categories
+    return dict(categories)
 
 
-def generate_js(categories):
-    """Generate a JS string defining CODE_OPTIONS from grouped categories."""
-    lines = ['const CODE_OPTIONS = {']
+def write_js(file, categories):
+    """Write the JS defining CODE_OPTIONS from grouped categories to an open text file.
+
+    Each record is written as soon as it is formatted, so the whole file is
+    never held in memory at once.
+    """
+    # json.dumps produces valid, escaped JS string literals
+    quote = json.dumps
+    write = file.write
+    write('const CODE_OPTIONS = {\n')
 
     sorted_cats = sorted(categories.keys())
     for i, cat in enumerate(sorted_cats):
         options = categories[cat]
-        lines.append(f'    {cat}: [')
+        write(f'    {cat}: [\n')
 
+        # One f-string per record: a single formatting operation and one
+        # write, instead of one per field
+        last = len(options) - 1
         for j, opt in enumerate(options):
-            lines.append('        {')
-            lines.append(f'            id: "{opt["id"]}",')
-            lines.append(f'            name: "{opt["name"]}",')
-            lines.append(f'            description: "{opt["description"]}",')
-            if 'whyItMatters' in opt:
-                lines.append(f'            whyItMatters: "{opt["whyItMatters"]}",')
-            lines.append(f'            codeClass: "{opt["codeClass"]}",')
-            lines.append(f'            scheme: "{opt["scheme"]}",')
-            lines.append(f'            lastModified: "{opt["lastModified"]}"')
-            trailing = ',' if j < len(options) - 1 else ''
-            lines.append(f'        }}{trailing}')
+            why = f'            whyItMatters: {quote(opt["whyItMatters"])},\n' if 'whyItMatters' in opt else ''
+            trailing = ',' if j < last else ''
+            write(
+                f'        {{\n'
+                f'            id: {quote(opt["id"])},\n'
+                f'            name: {quote(opt["name"])},\n'
+                f'            description: {quote(opt["description"])},\n'
+                f'{why}'
+                f'            codeClass: {quote(opt["codeClass"])},\n'
+                f'            scheme: {quote(opt["scheme"])},\n'
+                f'            lastModified: {quote(opt["lastModified"])}\n'
+                f'        }}{trailing}\n'
+            )
 
         trailing = ',' if i < len(sorted_cats) - 1 else ''
-        lines.append(f'    ]{trailing}')
+        write(f'    ]{trailing}\n')
+
+    write('};\n')
 
-    lines.append('};')
-    lines.append('')
-    return '\n'.join(lines)
+
+def generate_js(categories):
+    """Generate a JS string defining CODE_OPTIONS from grouped categories."""
+    buf = io.StringIO()
+    write_js(buf, categories)
+    return buf.getvalue()
 
 
 def parse_spec_capabilities(code):
@@ -260,30 +608,12 @@ def parse_spec_capabilities(code):
     attribute fields plus auto-extracted methodName, returnType, parameters.
     Returns an empty list if no [SpecCapability] found.
     """
-    results = []
-    for match in SPEC_CAPABILITY_RE.finditer(code):
-        body = match.group(1)
-        fields = extract_params(body)
-
-        if 'Category' not in fields or 'Name' not in fields:
-            continue
-
-        # Find the method signature that follows this specific attribute
-        # Search from the start of this attribute match
-        sig_search = METHOD_SIG_RE.search(code, match.start())
-        if sig_search:
-            fields['returnType'] = sig_search.group(1).strip()
-            fields['methodName'] = sig_search.group(2)
-            fields['parameters'] = sig_search.group(3).strip()
-
-        results.append(fields)
-
-    return results
+    return parse_file(code)[1]
 
 
 def process_capabilities(modules, verbose=False):
     """Process a list of module dicts and return capabilities grouped by category."""
-    categories = {}
+    categories = defaultdict(list)
 
     for module in modules:
         module_name = module.get('moduleName', '<unknown>')
@@ -294,18 +624,15 @@ def process_capabilities(modules, verbose=False):
                 print(f"  SKIP {module_name}: no code")
             continue
 
-        capabilities = parse_spec_capabilities(code)
+        parent_option, capabilities, class_name, _ = get_parsed(module)
         if not capabilities:
             if verbose:
                 print(f"  SKIP {module_name}: no [SpecCapability] attribute")
             continue
 
-        # Extract class name for codeClass field
-        class_match = re.search(r'public\s+class\s+(\w+)', code)
-        code_class = class_match.group(1) if class_match else module_name
+        code_class = class_name or module_name
 
         # Check for a parent [SpecOption] on the same class
-        parent_option = parse_spec_option(code)
         parent_info = None
         if parent_option and 'Category' in parent_option and 'Name' in parent_option:
             parent_info = {
@@ -313,12 +640,15 @@ def process_capabilities(modules, verbose=False):
                 'name': parent_option['Name'],
             }
 
+        # Keep only the date part; slicing at the 'T' allocates no list
         last_modified = module.get('lastModified', '')
-        if last_modified and 'T' in last_modified:
-            last_modified = last_modified.split('T')[0]
+        if last_modified:
+            date_end = last_modified.find('T')
+            if date_end >= 0:
+                last_modified = last_modified[:date_end]
 
         for fields in capabilities:
-            category = fields['Category'].lower()
+            category = sys.intern(fields['Category'].lower())
 
             capability = {
                 'id': to_snake_id(fields.get('methodName', fields['Name'])),
@@ -342,57 +672,73 @@ def process_capabilities(modules, verbose=False):
             if parent_info:
                 capability['parentOption'] = parent_info
 
-            categories.setdefault(category, []).append(capability)
+            categories[category].append(capability)
 
             if verbose:
                 print(f"  FOUND capability {module_name} -> {category}/{capability['id']}")
 
-    return categories
+    return dict(categories)
 
 
-def generate_capabilities_js(categories):
-    """Generate a JS string defining CODE_CAPABILITIES from grouped categories."""
-    lines = ['const CODE_CAPABILITIES = {']
+def write_capabilities_js(file, categories):
+    """Write the JS defining CODE_CAPABILITIES from grouped categories to an open text file.
+
+    Each record is written as soon as it is formatted, so the whole file is
+    never held in memory at once.
+    """
+    quote = json.dumps
+    write = file.write
+    write('const CODE_CAPABILITIES = {\n')
 
     sorted_cats = sorted(categories.keys())
     for i, cat in enumerate(sorted_cats):
         caps = categories[cat]
-        lines.append(f'    {cat}: [')
+        write(f'    {cat}: [\n')
 
+        # One f-string per record, as in generate_js
+        last = len(caps) - 1
         for j, cap in enumerate(caps):
-            lines.append('        {')
-            lines.append(f'            id: "{cap["id"]}",')
-            lines.append(f'            name: "{cap["name"]}",')
-            lines.append(f'            description: "{cap["description"]}",')
-            if 'whyItMatters' in cap:
-                lines.append(f'            whyItMatters: "{cap["whyItMatters"]}",')
-            if 'methodName' in cap:
-                lines.append(f'            methodName: "{cap["methodName"]}",')
-            if 'returnType' in cap:
-                lines.append(f'            returnType: "{cap["returnType"]}",')
-            if 'parameters' in cap:
-                lines.append(f'            parameters: "{cap["parameters"]}",')
-            if 'parentOption' in cap:
-                lines.append(f'            parentOption: {{ id: "{cap["parentOption"]["id"]}", name: "{cap["parentOption"]["name"]}" }},')
-            lines.append(f'            codeClass: "{cap["codeClass"]}",')
-            lines.append(f'            scheme: "{cap["scheme"]}",')
-            lines.append(f'            lastModified: "{cap["lastModified"]}"')
-            trailing = ',' if j < len(caps) - 1 else ''
-            lines.append(f'        }}{trailing}')
+            why = f'            whyItMatters: {quote(cap["whyItMatters"])},\n' if 'whyItMatters' in cap else ''
+            method = f'            methodName: {quote(cap["methodName"])},\n' if 'methodName' in cap else ''
+            returns = f'            returnType: {quote(cap["returnType"])},\n' if 'returnType' in cap else ''
+            params = f'            parameters: {quote(cap["parameters"])},\n' if 'parameters' in cap else ''
+            parent = cap.get('parentOption')
+            if parent:
+                parent = f'            parentOption: {{ id: {quote(parent["id"])}, name: {quote(parent["name"])} }},\n'
+            else:
+                parent = ''
+            trailing = ',' if j < last else ''
+            write(
+                f'        {{\n'
+                f'            id: {quote(cap["id"])},\n'
+                f'            name: {quote(cap["name"])},\n'
+                f'            description: {quote(cap["description"])},\n'
+                f'{why}{method}{returns}{params}{parent}'
+                f'            codeClass: {quote(cap["codeClass"])},\n'
+                f'            scheme: {quote(cap["scheme"])},\n'
+                f'            lastModified: {quote(cap["lastModified"])}\n'
+                f'        }}{trailing}\n'
+            )
 
         trailing = ',' if i < len(sorted_cats) - 1 else ''
-        lines.append(f'    ]{trailing}')
+        write(f'    ]{trailing}\n')
 
-    lines.append('};')
-    lines.append('')
-    return '\n'.join(lines)
+    write('};\n')
+
+
+def generate_capabilities_js(categories):
+    """Generate a JS string defining CODE_CAPABILITIES from grouped categories."""
+    buf = io.StringIO()
+    write_capabilities_js(buf, categories)
+    return buf.getvalue()
 
 
 def generate_coverage_report(modules, verbose=False):
     """Generate a coverage report showing public methods vs [SpecCapability] methods per class.
 
     Only reports on classes that have a [SpecOption] attribute.
-    Returns the report as a string.
+    Returns the report as a string. This is a pure aggregation over the
+    results cached by annotate_modules(); no code is scanned here.
     """
     lines = []
     total_documented = 0
@@ -400,28 +746,19 @@ def generate_coverage_report(modules, verbose=False):
     class_count = 0
 
     for module in modules:
-        code = module.get('code', '')
-        if not code:
-            continue
-
         # Only report on classes with [SpecOption]
-        option = parse_spec_option(code)
+        option, capabilities, _, method_names = get_parsed(module)
         if not option:
             continue
 
         class_name = option.get('CodeClass', module.get('moduleName', '<unknown>'))
 
-        # Count public methods (exclude constructors — method name != class name)
-        public_methods = []
-        for m in PUBLIC_METHOD_RE.finditer(code):
-            method_name = m.group(1)
-            if method_name != class_name:
-                public_methods.append(method_name)
+        # Count public methods (exclude constructors — method name != class name),
+        # counting the constructors in C rather than filtering in Python
+        total = len(method_names) - method_names.count(class_name)
 
         # Count [SpecCapability] decorated methods
-        capabilities = parse_spec_capabilities(code)
         documented = len(capabilities)
-        total = len(public_methods)
 
         total_documented += documented
         total_public += total
@@ -442,17 +779,21 @@ def generate_coverage_report(modules, verbose=False):
 
 def format_category(key):
     """Format a category key for display, preserving known acronyms."""
-    known = {'gmp', 'dc', 'pcls', 'erf', 'lrf', 'afr', 'cetv'}
     words = key.replace('_', ' ').split()
-    return ' '.join(w.upper() if w.lower() in known else w.title() for w in words)
+    return ' '.join(w.upper() if w.lower() in KNOWN_ACRONYMS else w.title() for w in words)
+
 
+def generate_preview(categories, cap_categories, total_options=None, total_caps=None):
+    """Generate a compact human-readable summary of extracted options and capabilities.
 
-def generate_preview(categories, cap_categories):
-    """Generate a compact human-readable summary of extracted options and capabilities."""
+    Callers that have already counted the options and capabilities can pass
+    the totals in; otherwise they are counted here.
+    """
     lines = []
 
     # Options
-    total_options = sum(len(opts) for opts in categories.values())
+    if total_options is None:
+        total_options = sum(len(opts) for opts in categories.values())
     lines.append(f'Options ({total_options}):')
     if total_options == 0:
         lines.append('  (none)')
@@ -464,7 +805,8 @@ def generate_preview(categories, cap_categories):
     lines.append('')
 
     # Capabilities — group by parent
-    total_caps = sum(len(caps) for caps in cap_categories.values())
+    if total_caps is None:
+        total_caps = sum(len(caps) for caps in cap_categories.values())
     lines.append(f'Capabilities ({total_caps}):')
     if total_caps == 0:
         lines.append('  (none)')
@@ -507,6 +849,12 @@ def main():
                         help='Print a formatted summary of extracted options and capabilities')
     parser.add_argument('--coverage', action='store_true',
                         help='Print a coverage report showing documented vs total public methods')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Worker processes for reading and parsing .cs files; 0 means one per CPU '
+                             '(default: 1, read in-process)')
+    parser.add_argument('--cache', metavar='PATH', default=None,
+                        help='Reuse parse results for unchanged .cs files from this cache file, '
+                             'creating it if missing (directory mode only)')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Print diagnostic output')
     args = parser.parse_args()
@@ -523,10 +871,13 @@ def main():
             sys.exit(1)
         if args.verbose:
             print(f"Scanning {args.input} for .cs files...")
-        modules = load_modules_from_dir(args.input, verbose=args.verbose)
+        modules = load_modules_from_dir(args.input, verbose=args.verbose, jobs=args.jobs or None,
+                                         cache_path=args.cache)
         if args.verbose:
             print(f"Loaded {len(modules)} .cs files from {args.input}")
 
+    annotate_modules(modules)
+
     # --- Spec Options pipeline ---
     if args.verbose:
         print("\n--- Spec Options ---")
@@ -538,10 +889,8 @@ def main():
         for cat, opts in sorted(categories.items()):
             print(f"  {cat}: {len(opts)} options")
 
-    js_output = generate_js(categories)
-
-    with open(args.output, 'w') as f:
-        f.write(js_output)
+    with open(args.output, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+        write_js(f, categories)
 
     if args.verbose:
         print(f"Wrote {args.output}")
@@ -557,10 +906,8 @@ def main():
         for cat, caps in sorted(cap_categories.items()):
             print(f"  {cat}: {len(caps)} capabilities")
 
-    caps_js_output = generate_capabilities_js(cap_categories)
-
-    with open(args.capabilities_output, 'w') as f:
-        f.write(caps_js_output)
+    with open(args.capabilities_output, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+        write_capabilities_js(f, cap_categories)
 
     if args.verbose:
         print(f"Wrote {args.capabilities_output}")
@@ -569,7 +916,7 @@ def main():
     if args.preview:
         if args.verbose:
             print()
-        print(generate_preview(categories, cap_categories))
+        print(generate_preview(categories, cap_categories, total_options, total_caps))
 
     # --- Coverage report ---
     if args.coverage:
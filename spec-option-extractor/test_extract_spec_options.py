@@ -3,12 +3,14 @@
 
 import json
 import os
+import pickle
 import shutil
 import sys
 import tempfile
 import unittest
 
 from extract_spec_options import (
+    PARALLEL_MIN_FILES,
     extract_params,
     parse_spec_option,
     parse_spec_capabilities,
@@ -18,10 +20,18 @@ from extract_spec_options import (
     generate_capabilities_js,
     generate_coverage_report,
     load_modules_from_dir,
+    get_parsed,
+    annotate_modules,
     to_snake_id,
 )
 
 
+def canonical_names(categories):
+    """Reduce grouped records to a hashable (category, sorted names) form for comparison."""
+    return tuple((cat, tuple(sorted(rec['name'] for rec in recs)))
+                 for cat, recs in sorted(categories.items()))
+
+
 class TestParseSpecOption(unittest.TestCase):
     """Tests for parsing [SpecOption] attributes from C# code."""
 
@@ -95,6 +105,109 @@ class TestParseSpecOption(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestGetParsed(unittest.TestCase):
+    """Tests for the per-module parse cache shared by every pipeline stage."""
+
+    def test_parses_option_capabilities_and_class(self):
+        module = {
+            'moduleName': 'Calc',
+            'code': (
+                '[SpecOption(Category = "GMP", Name = "Calc", Description = "Calc")]\n'
+                'public class Calc {\n'
+                '    [SpecCapability(Category = "GMP", Name = "Do", Description = "Do")]\n'
+                '    public void Do() { }\n'
+                '}\n'
+            ),
+        }
+        option, capabilities, class_name, public_methods = get_parsed(module)
+        self.assertEqual(option['Name'], 'Calc')
+        self.assertEqual(len(capabilities), 1)
+        self.assertEqual(class_name, 'Calc')
+        self.assertEqual(public_methods, ['Do'])
+
+    def test_commented_out_code_ignored(self):
+        module = {
+            'moduleName': 'Calc',
+            'code': (
+                'public class Calc {\n'
+                '    // [SpecCapability(Category = "GMP", Name = "Old", Description = "Old")]\n'
+                '    // public void Old() { }\n'
+                '    public void Do() { }\n'
+                '}\n'
+            ),
+        }
+        _, capabilities, _, public_methods = get_parsed(module)
+        self.assertEqual(capabilities, [])
+        self.assertEqual(public_methods, ['Do'])
+
+    def test_block_commented_code_ignored(self):
+        module = {
+            'moduleName': 'Calc',
+            'code': (
+                'public class Calc {\n'
+                '    /* [SpecCapability(Category = "GMP", Name = "Old", Description = "Old")]\n'
+                '       public void Old() { } */\n'
+                '    [SpecCapability(Category = "GMP", Name = "Do", Description = "Do")]\n'
+                '    public void Do() { }\n'
+                '}\n'
+            ),
+        }
+        _, capabilities, _, public_methods = get_parsed(module)
+        self.assertEqual([c['Name'] for c in capabilities], ['Do'])
+        self.assertEqual(public_methods, ['Do'])
+
+    def test_comment_markers_inside_literals(self):
+        module = {
+            'moduleName': 'Api',
+            'code': (
+                '[SpecOption(Category = "GMP", Name = "Api", Description = "Api")]\n'
+                'public class Api {\n'
+                '    const string P = "/api/*";\n'
+                '    const string U = "http://example.com"; public void Ping() { }\n'
+                '    const string V = @"C:\\Data\\"; const char Q = \'"\';\n'
+                '    [SpecCapability(Category = "GMP", Name = "Get", Description = "Get")]\n'
+                '    public int Get() { return 1; }\n'
+                '    /* x */\n'
+                '    public void Put() { }\n'
+                '}\n'
+            ),
+        }
+        _, capabilities, _, public_methods = get_parsed(module)
+        self.assertEqual([c['methodName'] for c in capabilities], ['Get'])
+        self.assertEqual(public_methods, ['Ping', 'Get', 'Put'])
+        report = generate_coverage_report([module])
+        self.assertIn('Api: 1/3 methods documented (33%)', report)
+
+    def test_file_without_spec_attributes(self):
+        module = {'moduleName': 'Helper', 'code': 'public class Helper {\n    public void Do() { }\n}'}
+        self.assertEqual(get_parsed(module), (None, [], None, []))
+
+    def test_result_cached_on_module(self):
+        module = {'moduleName': 'A', 'code': 'public class A { }'}
+        first = get_parsed(module)
+        self.assertIs(module['_parsed'], first)
+        self.assertIs(get_parsed(module), first)
+
+    def test_annotate_modules_parses_each_module_once(self):
+        modules = [
+            {'moduleName': 'A', 'code': 'public class A { }'},
+            {'moduleName': 'B', 'code': '[SpecOption(Category = "x", Name = "B")]\npublic class B { }'},
+        ]
+        self.assertIs(annotate_modules(modules), modules)
+        self.assertTrue(all('_parsed' in m for m in modules))
+        cached = modules[1]['_parsed']
+        process_modules(modules)
+        generate_coverage_report(modules)
+        self.assertIs(modules[1]['_parsed'], cached)
+
+    def test_annotate_modules_with_null_code(self):
+        modules = json.loads('[{"moduleName": "Empty", "scheme": "Core", "code": null, "lastModified": ""}]')
+        annotate_modules(modules)
+        self.assertEqual(get_parsed(modules[0]), (None, [], None, []))
+        self.assertEqual(process_modules(modules), {})
+        self.assertEqual(process_capabilities(modules), {})
+
+
 class TestToSnakeId(unittest.TestCase):
 
     def test_pascal_case(self):
@@ -109,6 +222,10 @@ class TestToSnakeId(unittest.TestCase):
     def test_consecutive_caps(self):
         self.assertEqual(to_snake_id('GMPEqualiser'), 'gmp_equaliser')
 
+    def test_digits_and_separator_runs(self):
+        self.assertEqual(to_snake_id('Section148Revaluation'), 'section148_revaluation')
+        self.assertEqual(to_snake_id('CPI - Capped  Rate'), 'cpi_capped_rate')
+
 
 class TestProcessModules(unittest.TestCase):
 
@@ -168,6 +285,18 @@ class TestProcessModules(unittest.TestCase):
         result = process_modules(modules)
         self.assertEqual(result['gmp'][0]['lastModified'], '2025-11-15')
 
+    def test_null_last_modified_passed_through(self):
+        modules = [
+            {
+                'moduleName': 'X',
+                'scheme': 'Core',
+                'code': '[SpecOption(Category = "GMP", Name = "X", Description = "X")]\npublic class X { }',
+                'lastModified': None
+            },
+        ]
+        result = process_modules(modules)
+        self.assertIsNone(result['gmp'][0]['lastModified'])
+
     def test_builder_category_pluralised(self):
         modules = [
             {
@@ -261,6 +390,40 @@ class TestGenerateJs(unittest.TestCase):
         js = generate_js(categories)
         self.assertNotIn('whyItMatters', js)
 
+    def test_string_values_escaped(self):
+        categories = {
+            'gmp': [
+                {
+                    'id': 'quoted',
+                    'name': 'Say "hi"',
+                    'description': 'Back\\slash and\nnewline.',
+                    'codeClass': 'Quoted',
+                    'scheme': 'Core',
+                    'lastModified': '2025-01-01',
+                }
+            ]
+        }
+        js = generate_js(categories)
+        self.assertIn('name: "Say \\"hi\\""', js)
+        self.assertIn('description: "Back\\\\slash and\\nnewline."', js)
+
+    def test_null_values_written_as_null(self):
+        categories = {
+            'gmp': [
+                {
+                    'id': 'x',
+                    'name': 'X',
+                    'description': '',
+                    'codeClass': 'X',
+                    'scheme': None,
+                    'lastModified': None,
+                }
+            ]
+        }
+        js = generate_js(categories)
+        self.assertIn('scheme: null,', js)
+        self.assertIn('lastModified: null\n', js)
+
     def test_empty_categories(self):
         js = generate_js({})
         self.assertEqual(js, 'const CODE_OPTIONS = {\n};\n')
@@ -379,6 +542,21 @@ class TestParseSpecCapabilities(unittest.TestCase):
         self.assertEqual(result[0]['methodName'], 'CheckLifetimeAllowance')
         self.assertEqual(result[0]['parameters'], 'decimal totalBenefits, decimal ltaLimit')
 
+    def test_signature_not_taken_from_later_capability(self):
+        code = '''
+        public class Calc {
+            [SpecCapability(Category = "A", Name = "Rate", Description = "On a property.")]
+            public decimal Rate { get; set; }
+
+            [SpecCapability(Category = "A", Name = "Do", Description = "On a method.")]
+            public void DoThing() { }
+        }
+        '''
+        result = parse_spec_capabilities(code)
+        self.assertEqual(len(result), 2)
+        self.assertNotIn('methodName', result[0])
+        self.assertEqual(result[1]['methodName'], 'DoThing')
+
     def test_missing_required_fields(self):
         code = '''
         public class Foo {
@@ -431,6 +609,18 @@ class TestProcessCapabilities(unittest.TestCase):
         result = process_capabilities(modules)
         self.assertEqual(result['a'][0]['lastModified'], '2025-11-15')
 
+    def test_null_last_modified_passed_through(self):
+        modules = [
+            {
+                'moduleName': 'X',
+                'scheme': 'Core',
+                'code': 'public class X {\n[SpecCapability(Category = "A", Name = "Y", Description = "Z")]\npublic void Do()\n{\n}\n}',
+                'lastModified': None
+            },
+        ]
+        result = process_capabilities(modules)
+        self.assertIsNone(result['a'][0]['lastModified'])
+
     def test_includes_method_signature_fields(self):
         modules = [
             {
@@ -447,6 +637,24 @@ class TestProcessCapabilities(unittest.TestCase):
         self.assertEqual(cap['parameters'], 'decimal total, decimal limit')
         self.assertEqual(cap['codeClass'], 'Calc')
 
+    def test_code_class_is_first_plain_public_class(self):
+        modules = [
+            {
+                'moduleName': 'Calc',
+                'scheme': 'Core',
+                'code': (
+                    'public static class Ext { }\n'
+                    'public class Calc {\n'
+                    '    [SpecCapability(Category = "A", Name = "Y", Description = "Z")]\n'
+                    '    public void Do() { }\n'
+                    '}\n'
+                ),
+                'lastModified': ''
+            },
+        ]
+        result = process_capabilities(modules)
+        self.assertEqual(result['a'][0]['codeClass'], 'Calc')
+
     def test_parent_option_included_when_present(self):
         modules = [
             {
@@ -513,6 +721,14 @@ class TestGenerateCapabilitiesJs(unittest.TestCase):
         transfers_pos = js.index('transfers:')
         self.assertLess(gmp_pos, transfers_pos)
 
+    def test_null_values_written_as_null(self):
+        categories = {
+            'gmp': [{'id': 'a', 'name': 'A', 'description': '', 'codeClass': 'A', 'scheme': None, 'lastModified': None}],
+        }
+        js = generate_capabilities_js(categories)
+        self.assertIn('scheme: null,', js)
+        self.assertIn('lastModified: null\n', js)
+
     def test_includes_parent_option_when_present(self):
         categories = {
             'gmp': [
@@ -577,6 +793,94 @@ class TestLoadModulesFromDir(unittest.TestCase):
         modules = load_modules_from_dir(self.tmpdir)
         self.assertEqual(len(modules), 2)
 
+    def test_cache_reuses_unchanged_files(self):
+        cache_path = os.path.join(self.tmpdir, 'parse.cache')
+        path_a = self._write_file('Core/A.cs', '[SpecOption(Category = "x", Name = "A")]\npublic class A { }')
+        self._write_file('Core/B.cs', 'public class B { }')
+        first = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        with open(cache_path) as f:
+            self.assertEqual(len(json.load(f)['files']), 2)
+
+        # Nothing changed: cached modules come back exactly as parsed
+        self.assertEqual(load_modules_from_dir(self.tmpdir, cache_path=cache_path), first)
+
+        # Same size and mtime: the cached parse is used without reading the file
+        st = os.stat(path_a)
+        with open(path_a, 'w') as f:
+            f.write('[SpecOption(Category = "x", Name = "Z")]\npublic class A { }')
+        os.utime(path_a, ns=(st.st_atime_ns, st.st_mtime_ns))
+        second = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        self.assertEqual(get_parsed(second[0])[0]['Name'], 'A')
+        self.assertEqual([m['code'] for m in second], [m['code'] for m in first])
+
+        # A changed stat invalidates just that file
+        os.utime(path_a, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        third = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        self.assertEqual(get_parsed(third[0])[0]['Name'], 'Z')
+
+    def test_unreadable_cache_is_ignored(self):
+        cache_path = os.path.join(self.tmpdir, 'parse.cache')
+        with open(cache_path, 'w') as f:
+            f.write('not a cache')
+        self._write_file('Core/A.cs', 'public class A { }')
+        modules = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        self.assertEqual(len(modules), 1)
+
+    def test_cache_with_empty_file(self):
+        cache_path = os.path.join(self.tmpdir, 'parse.cache')
+        self._write_file('Core/Empty.cs', '')
+        self._write_file('Core/A.cs', '[SpecOption(Category = "x", Name = "A")]\npublic class A { }')
+        first = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        second = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        self.assertEqual(second, first)
+        self.assertEqual(get_parsed(second[0])[0]['Name'], 'A')
+
+    def test_malformed_cache_entries_are_misses(self):
+        cache_path = os.path.join(self.tmpdir, 'parse.cache')
+        path_a = self._write_file('Core/A.cs', '[SpecOption(Category = "x", Name = "A")]\npublic class A { }')
+        path_b = self._write_file('Core/B.cs', 'public class B { }')
+        first = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        with open(cache_path) as f:
+            cache = json.load(f)
+        stamp_b = cache['files'][path_b][0]
+        cache['files'][path_a] = 'not an entry'
+        cache['files'][path_b] = [stamp_b, {'moduleName': 'B', 'code': 'public class B { }'}]
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
+        self.assertEqual(load_modules_from_dir(self.tmpdir, cache_path=cache_path), first)
+
+    def test_pickled_cache_is_not_loaded(self):
+        cache_path = os.path.join(self.tmpdir, 'parse.cache')
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'files': {}}, f, pickle.HIGHEST_PROTOCOL)
+        self._write_file('Core/A.cs', 'public class A { }')
+        modules = load_modules_from_dir(self.tmpdir, cache_path=cache_path)
+        self.assertEqual([m['moduleName'] for m in modules], ['A'])
+        with open(cache_path) as f:
+            self.assertIn('files', json.load(f))
+
+    def test_hidden_directories_skipped(self):
+        self._write_file('Core/A.cs', 'public class A { }')
+        self._write_file('.vs/Cache/B.cs', 'public class B { }')
+        modules = load_modules_from_dir(self.tmpdir)
+        self.assertEqual([m['moduleName'] for m in modules], ['A'])
+
+    def test_build_directories_pruned(self):
+        self._write_file('Core/A.cs', 'public class A { }')
+        self._write_file('Core/obj/Debug/A.AssemblyInfo.cs', 'public class Info { }')
+        self._write_file('Core/bin/B.cs', 'public class B { }')
+        modules = load_modules_from_dir(self.tmpdir)
+        self.assertEqual([m['moduleName'] for m in modules], ['A'])
+        modules = load_modules_from_dir(self.tmpdir, prune=frozenset())
+        self.assertEqual(len(modules), 3)
+
+    def test_crlf_and_invalid_bytes(self):
+        full_path = os.path.join(self.tmpdir, 'A.cs')
+        with open(full_path, 'wb') as f:
+            f.write(b'// caf\xe9\r\npublic class A { }\r\n')
+        modules = load_modules_from_dir(self.tmpdir)
+        self.assertEqual(modules[0]['code'], '// caf\ufffd\npublic class A { }\n')
+
     def test_scheme_from_subdirectory(self):
         self._write_file('Core/A.cs', 'public class A { }')
         self._write_file('SchemeXYZ/B.cs', 'public class B { }')
@@ -609,6 +913,25 @@ class TestLoadModulesFromDir(unittest.TestCase):
         modules = load_modules_from_dir(self.tmpdir)
         self.assertEqual(modules[0]['scheme'], '')
 
+    def test_files_listed_before_subdirectories(self):
+        self._write_file('Core/B.cs', 'public class B { }')
+        self._write_file('Core/A.cs', 'public class A { }')
+        self._write_file('Zed.cs', 'public class Zed { }')
+        modules = load_modules_from_dir(self.tmpdir)
+        self.assertEqual([m['moduleName'] for m in modules], ['Zed', 'A', 'B'])
+
+    def test_parallel_matches_serial(self):
+        for i in range(PARALLEL_MIN_FILES):
+            self._write_file(f'Core/Calc{i:03d}.cs', (
+                f'[SpecOption(Category = "GMP", Name = "Calc {i}", Description = "Calc")]\n'
+                f'public class Calc{i:03d} {{ }}\n'
+            ))
+        serial = load_modules_from_dir(self.tmpdir)
+        parallel = load_modules_from_dir(self.tmpdir, jobs=2)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(load_modules_from_dir(self.tmpdir, jobs=None), serial)
+        self.assertEqual(parallel[0]['_parsed'][0]['CodeClass'], 'Calc000')
+
     def test_sample_modules_directory(self):
         """Integration test using the actual sample-modules directory."""
         sample_dir = os.path.join(os.path.dirname(__file__), 'sample-modules')
@@ -667,6 +990,22 @@ class TestCoverageReport(unittest.TestCase):
         report = generate_coverage_report(modules)
         self.assertIn('Calc: 1/1 methods documented (100%)', report)
 
+    def test_module_without_code_skipped_like_process_modules(self):
+        modules = [{
+            'moduleName': 'Calc',
+            'code': (
+                '[SpecOption(Category = "Tax", Name = "Tax", Description = "Tax")]\n'
+                'public class Calc {\n'
+                '    public bool Check() { return true; }\n'
+                '}\n'
+            ),
+        }]
+        annotate_modules(modules)
+        modules[0]['code'] = ''
+        self.assertEqual(process_modules(modules), {})
+        report = generate_coverage_report(modules)
+        self.assertIn('No classes with [SpecOption] found.', report)
+
     def test_no_public_methods(self):
         modules = [
             {
@@ -800,6 +1139,51 @@ class TestRobustParsing(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result['CodeClass'], 'Section148Reval')
 
+    def test_parentheses_in_attribute_body(self):
+        code = '''
+        [SpecOption(Category = "Revaluation", Name = "CPI-Capped (s101)", Description = nameof(CpiReval))]
+        public class CpiReval : IRevalStrategy { }
+        '''
+        result = parse_spec_option(code)
+        self.assertIsNotNone(result)
+        self.assertEqual(result['Name'], 'CPI-Capped (s101)')
+        self.assertEqual(result['CodeClass'], 'CpiReval')
+
+    def test_strings_inside_nested_parentheses(self):
+        code = '''
+        [SpecOption(Category = "GMP", Name = "Long", Description = ("Long text " + "continued"))]
+        public class LongText { }
+        '''
+        result = parse_spec_option(code)
+        self.assertIsNotNone(result)
+        self.assertEqual(result['Name'], 'Long')
+        self.assertEqual(result['CodeClass'], 'LongText')
+
+    def test_attribute_does_not_bind_to_later_class(self):
+        """An attribute separated from the class by other code decorates something else."""
+        code = '''
+        [SpecOption(Category = "GMP", Name = "Field", Description = "Not a class.")]
+        private int _count;
+        [Obsolete("Old")]
+        public class Later { }
+        '''
+        result = parse_spec_option(code)
+        self.assertIsNotNone(result)
+        self.assertNotIn('CodeClass', result)
+
+    def test_many_members_without_signature(self):
+        """Runs of public members that are not methods stay linear to scan."""
+        code = (
+            'public class Calc {\n'
+            + '    public int a b c d e f\n' * 5000
+            + '    [SpecCapability(Category = "A", Name = "Do", Description = "Do.")]\n'
+            '    public void DoThing(\n        decimal a,\n        decimal b) { }\n'
+            '}\n'
+        )
+        result = parse_spec_capabilities(code)
+        self.assertEqual(result[0]['methodName'], 'DoThing')
+        self.assertEqual(result[0]['parameters'], 'decimal a,\n        decimal b')
+
     def test_generic_return_type_on_capability(self):
         code = '''
         public class Calc {
@@ -865,6 +1249,44 @@ class TestRobustParsing(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['methodName'], 'Equalise')
 
+    def test_verbatim_string_ending_in_backslash(self):
+        code = '''
+        [SpecOption(Category = "GMP", Name = "Path", Description = @"C:\\Data\\")]
+        [Obsolete(@"Use C:\\New\\")]
+        public class DataPath { }
+        '''
+        result = parse_spec_option(code)
+        self.assertIsNotNone(result)
+        self.assertEqual(result['Description'], 'C:\\Data\\')
+        self.assertEqual(result['CodeClass'], 'DataPath')
+
+    def test_two_levels_of_nested_parentheses(self):
+        code = '''
+        [SpecOption(Category = "GMP", Name = "Nested", Description = ("a" + nameof(X)))]
+        public class Nested { }
+        '''
+        result = parse_spec_option(code)
+        self.assertIsNotNone(result)
+        self.assertEqual(result['Name'], 'Nested')
+        self.assertEqual(result['CodeClass'], 'Nested')
+
+    def test_stacked_attribute_with_bracket_in_string(self):
+        code = '''
+        public class Calc {
+            [SpecCapability(Category = "GMP", Name = "Do", Description = "Does it.")]
+            [Obsolete("Use Foo[0] instead")]
+            public int Do(int n)
+            {
+                return n;
+            }
+        }
+        '''
+        result = parse_spec_capabilities(code)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['methodName'], 'Do')
+        self.assertEqual(result[0]['returnType'], 'int')
+        self.assertEqual(result[0]['parameters'], 'int n')
+
     def test_expression_bodied_method(self):
         code = '''
         public class Calc {
@@ -918,6 +1340,27 @@ class TestConstantReferences(unittest.TestCase):
         fields = extract_params(body)
         self.assertEqual(fields['Category'], 'SomeValue')
 
+    def test_extract_params_unescapes_string_literal(self):
+        body = r'Name = "Say \"hi\"", Description = "Line one\nline two \u00e9"'
+        fields = extract_params(body)
+        self.assertEqual(fields['Name'], 'Say "hi"')
+        self.assertEqual(fields['Description'], 'Line one\nline two \u00e9')
+
+    def test_extract_params_unescapes_all_csharp_escapes(self):
+        fields = extract_params(r'Name = "A\x41 \U0001F600 \a\b\f\v \x7Fz \UFFFFFFFF \q"')
+        self.assertEqual(fields['Name'], 'AA \U0001F600 \a\b\f\v \x7Fz \\UFFFFFFFF \\q')
+
+    def test_extract_params_verbatim_string(self):
+        fields = extract_params('Name = @"Say ""hi"" to C:\\", Category = "GMP"')
+        self.assertEqual(fields['Name'], 'Say "hi" to C:\\')
+        self.assertEqual(fields['Category'], 'GMP')
+
+    def test_extract_params_ignores_constants_inside_strings(self):
+        body = 'Name = "Test", Description = "Set Category = SpecCategories.GMP first."'
+        fields = extract_params(body)
+        self.assertNotIn('Category', fields)
+        self.assertEqual(fields['Description'], 'Set Category = SpecCategories.GMP first.')
+
     def test_extract_params_string_takes_priority_over_constant(self):
         """If somehow both regexes could match, string literal wins."""
         body = 'Category = "Revaluation", Name = "Test"'
@@ -983,12 +1426,17 @@ class TestConstantReferences(unittest.TestCase):
 class TestEndToEnd(unittest.TestCase):
     """Test the full pipeline using sample-input.json."""
 
-    def test_sample_input_options(self):
+    @classmethod
+    def setUpClass(cls):
+        # Loaded and processed once for the class; the tests only read the results
         sample_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
         with open(sample_path) as f:
-            modules = json.load(f)
+            cls.modules = json.load(f)
+        cls.options = process_modules(cls.modules)
+        cls.capabilities = process_capabilities(cls.modules)
 
-        categories = process_modules(modules)
+    def test_sample_input_options(self):
+        categories = self.options
 
         # Should have 3 categories from the sample data
         self.assertEqual(len(categories), 3)
@@ -1002,7 +1450,7 @@ class TestEndToEnd(unittest.TestCase):
         self.assertEqual(len(categories['gmp']), 1)
 
         # InternalHelper and TransferCalculator (no SpecOption) should be skipped
-        all_classes = [opt['codeClass'] for opts in categories.values() for opt in opts]
+        all_classes = {opt['codeClass'] for opts in categories.values() for opt in opts}
         self.assertNotIn('InternalHelper', all_classes)
         self.assertNotIn('TransferCalculator', all_classes)
 
@@ -1011,11 +1459,7 @@ class TestEndToEnd(unittest.TestCase):
         self.assertIn('const CODE_OPTIONS = {', js)
 
     def test_sample_input_capabilities(self):
-        sample_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
-        with open(sample_path) as f:
-            modules = json.load(f)
-
-        categories = process_capabilities(modules)
+        categories = self.capabilities
 
         # Should have 3 capability categories
         self.assertEqual(len(categories), 3)
@@ -1050,16 +1494,9 @@ class TestEndToEnd(unittest.TestCase):
 
     def test_options_and_capabilities_coexist(self):
         """Modules with both SpecOption and SpecCapability produce entries in both outputs."""
-        sample_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
-        with open(sample_path) as f:
-            modules = json.load(f)
-
-        options = process_modules(modules)
-        capabilities = process_capabilities(modules)
-
         # GmpEqualiser has both a SpecOption and SpecCapability
-        option_classes = [opt['codeClass'] for opts in options.values() for opt in opts]
-        cap_classes = [cap['codeClass'] for caps in capabilities.values() for cap in caps]
+        option_classes = {opt['codeClass'] for opts in self.options.values() for opt in opts}
+        cap_classes = {cap['codeClass'] for caps in self.capabilities.values() for cap in caps}
         self.assertIn('GmpEqualiser', option_classes)
         self.assertIn('GmpEqualiser', cap_classes)
 
@@ -1067,14 +1504,21 @@ class TestEndToEnd(unittest.TestCase):
 class TestEndToEndDirectory(unittest.TestCase):
     """Test the full pipeline using sample-modules/ directory."""
 
-    def setUp(self):
-        self.sample_dir = os.path.join(os.path.dirname(__file__), 'sample-modules')
-        if not os.path.isdir(self.sample_dir):
-            self.skipTest('sample-modules directory not found')
+    @classmethod
+    def setUpClass(cls):
+        # The directory scan and JSON load are shared by every test in the class
+        cls.sample_dir = os.path.join(os.path.dirname(__file__), 'sample-modules')
+        if not os.path.isdir(cls.sample_dir):
+            raise unittest.SkipTest('sample-modules directory not found')
+        cls.dir_modules = load_modules_from_dir(cls.sample_dir)
+        cls.options = process_modules(cls.dir_modules)
+        cls.capabilities = process_capabilities(cls.dir_modules)
+        json_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
+        with open(json_path) as f:
+            cls.json_modules = json.load(f)
 
     def test_directory_mode_options(self):
-        modules = load_modules_from_dir(self.sample_dir)
-        categories = process_modules(modules)
+        categories = self.options
 
         self.assertEqual(len(categories), 3)
         self.assertIn('revaluation', categories)
@@ -1085,8 +1529,7 @@ class TestEndToEndDirectory(unittest.TestCase):
         self.assertEqual(len(categories['gmp']), 1)
 
     def test_directory_mode_capabilities(self):
-        modules = load_modules_from_dir(self.sample_dir)
-        categories = process_capabilities(modules)
+        categories = self.capabilities
 
         self.assertEqual(len(categories), 3)
         self.assertIn('revaluation', categories)
@@ -1098,42 +1541,19 @@ class TestEndToEndDirectory(unittest.TestCase):
 
     def test_directory_vs_json_identical_options(self):
         """Directory mode and JSON mode should produce identical JS output (ignoring lastModified)."""
-        # Load from directory
-        dir_modules = load_modules_from_dir(self.sample_dir)
-        dir_categories = process_modules(dir_modules)
-
-        # Load from JSON
-        json_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
-        with open(json_path) as f:
-            json_modules = json.load(f)
-        json_categories = process_modules(json_modules)
+        json_categories = process_modules(self.json_modules)
 
-        # Same categories and same number of options
-        self.assertEqual(sorted(dir_categories.keys()), sorted(json_categories.keys()))
-        for cat in dir_categories:
-            dir_names = sorted(opt['name'] for opt in dir_categories[cat])
-            json_names = sorted(opt['name'] for opt in json_categories[cat])
-            self.assertEqual(dir_names, json_names, f"Mismatch in category {cat}")
+        # Same categories, each with the same option names
+        self.assertEqual(canonical_names(self.options), canonical_names(json_categories))
 
     def test_directory_vs_json_identical_capabilities(self):
         """Directory mode and JSON mode should produce identical capability names."""
-        dir_modules = load_modules_from_dir(self.sample_dir)
-        dir_categories = process_capabilities(dir_modules)
+        json_categories = process_capabilities(self.json_modules)
 
-        json_path = os.path.join(os.path.dirname(__file__), 'sample-input.json')
-        with open(json_path) as f:
-            json_modules = json.load(f)
-        json_categories = process_capabilities(json_modules)
-
-        self.assertEqual(sorted(dir_categories.keys()), sorted(json_categories.keys()))
-        for cat in dir_categories:
-            dir_names = sorted(cap['name'] for cap in dir_categories[cat])
-            json_names = sorted(cap['name'] for cap in json_categories[cat])
-            self.assertEqual(dir_names, json_names, f"Mismatch in category {cat}")
+        self.assertEqual(canonical_names(self.capabilities), canonical_names(json_categories))
 
     def test_coverage_report_from_directory(self):
-        modules = load_modules_from_dir(self.sample_dir)
-        report = generate_coverage_report(modules)
+        report = generate_coverage_report(self.dir_modules)
         self.assertIn('Coverage Report:', report)
         self.assertIn('GmpEqualiser:', report)
         self.assertIn('Overall:', report)